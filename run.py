@@ -1,24 +1,183 @@
 from __future__ import annotations
 
+import argparse
+import functools
 import json
 import math
 import os
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Mapping, Sequence, Tuple
 
+import numpy as np
 
-def _as_float(values: Dict[str, Any], *keys: str, default: float | None = None) -> float | None:
-    for key in keys:
-        if key in values and values[key] is not None:
-            try:
-                return float(values[key])
-            except (TypeError, ValueError):
-                continue
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+try:
+    from numba import njit, prange, vectorize
+
+    _HAVE_NUMBA = True
+except ImportError:  # pure-Python fallback: kernels run uncompiled
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def vectorize(*args: Any, **kwargs: Any) -> Any:
+        return lambda func: np.vectorize(func, otypes=[np.float64])
+
+
+# Compiled kernels carry "infinite" results as this finite sentinel (negated for -inf); _from_core_float maps
+# anything at or beyond _BIG_THRESHOLD in magnitude back to +/-inf at the API edge.
+_BIG = 1e300
+_BIG_THRESHOLD = 1e299
+# NaN marks missing optional inputs, so the no-NaN/no-Inf fast-math assumptions stay off, as do reassociation and
+# reciprocal approximation. FMA contraction and approximate math functions are allowed, so compiled results may
+# differ from the NumPy formulas in the last bit (log2 also comes from a different math library there).
+_FASTMATH = {"nsz", "contract", "afn"}
+
+SAMPLING_REGIMES = (
+    "optics-limited (diffraction)",
+    "optics-limited (aberrations)",
+    "sensor-limited",
+    "balanced",
+)
+
+
+# Field order of the tuple returned by _core and of RESULT_DTYPE, grouped by results.json category.
+_CORE_CATEGORIES = (
+    ("sensor", ("pixels_horz", "pixels_vert", "total_pixels", "aspect_ratio", "sensor_nyquist_lp_per_mm")),
+    ("lens_geometry", ("aperture_diameter_mm", "effective_f_number", "working_distance_mm", "image_distance_mm", "magnification_percent")),
+    (
+        "fov_sampling",
+        (
+            "fov_width_mm",
+            "fov_height_mm",
+            "fov_diagonal_mm",
+            "fov_area_mm2",
+            "pixels_per_mm_x",
+            "pixels_per_mm_y",
+            "mm_per_pixel_x",
+            "mm_per_pixel_y",
+            "fov_width_actual_vs_target_percent",
+            "fov_height_actual_vs_target_percent",
+        ),
+    ),
+    (
+        "motion_exposure",
+        (
+            "object_speed_mm_s",
+            "object_speed_px_s",
+            "frame_period_us",
+            "max_exposure_us_motion_blur_for_allowed_blur_px",
+            "max_exposure_us_frame",
+            "recommended_exposure_us",
+        ),
+    ),
+    ("depth_of_field", ("circle_of_confusion_mm_used", "near_mm", "far_mm", "DOF_mm", "hyperfocal_mm")),
+    (
+        "diffraction_mtf",
+        (
+            "wavelength_um",
+            "airy_disk_diameter_um",
+            "airy_disk_diameter_pixels",
+            "diffraction_cutoff_lp_per_mm",
+            "nyquist_over_diffraction_cutoff",
+            "lens_mtf50_lp_per_mm",
+            "mtf50_vs_nyquist_ratio",
+            "sampling_regime",
+        ),
+    ),
+    (
+        "coverage_distortion",
+        (
+            "coverage_ok",
+            "coverage_margin_mm",
+            "coverage_ratio_actual_vs_design",
+            "fov_width_scale_vs_design",
+            "fov_height_scale_vs_design",
+            "fov_area_scale_vs_design",
+            "effective_distortion_percent_at_actual_edge",
+            "edge_position_error_mm_effective",
+        ),
+    ),
+    (
+        "illumination",
+        (
+            "relative_illumination_center_percent",
+            "relative_illumination_corner_percent",
+            "corner_to_center_ratio",
+            "vignetting_loss_percent",
+            "exposure_compensation_stops_at_corners",
+        ),
+    ),
+    (
+        "appearances",
+        (
+            "appearance_axis_used",
+            "traversal_extent_mm",
+            "duration_s",
+            "expected_frames",
+            "frames_min",
+            "frames_max",
+            "displacement_per_frame_mm",
+            "displacement_per_frame_px",
+        ),
+    ),
+    ("flags", ("diffraction_dominant", "exposure_limited_by_frame", "potential_vignetting")),
+)
+_CORE_OUTPUTS = tuple((category, name) for category, names in _CORE_CATEGORIES for name in names)
+_CORE_WIDTH = len(_CORE_OUTPUTS)
+
+# One flat float64 record per configuration, so compiled kernels can fill it through a plain 2-D view.
+# Non-float results are coded: sampling_regime indexes SAMPLING_REGIMES, appearance_axis_used is 1.0 for "H"
+# and 0.0 for "W", flags and coverage_ok are 1.0/0.0, and frames_min/frames_max hold whole numbers.
+RESULT_DTYPE = np.dtype([(name, np.float64) for _, name in _CORE_OUTPUTS])
+
+_ROW_DECODERS = {
+    "sampling_regime": lambda value: SAMPLING_REGIMES[int(value)],
+    "coverage_ok": bool,
+    "appearance_axis_used": lambda value: "H" if value else "W",
+    "frames_min": int,
+    "frames_max": int,
+    "diffraction_dominant": bool,
+    "exposure_limited_by_frame": bool,
+    "potential_vignetting": bool,
+}
+_DECODED_FIELDS = tuple((index, _ROW_DECODERS[name]) for index, (_, name) in enumerate(_CORE_OUTPUTS) if name in _ROW_DECODERS)
+
+
+# Below this many rows the thread-pool start-up outweighs the parallel kernel; calculate_batch stays on NumPy.
+_PARALLEL_MIN_ROWS = 1024
+
+
+@njit(cache=True, error_model="numpy")
+def _from_core_float(value: float) -> float:
+    if -_BIG_THRESHOLD < value < _BIG_THRESHOLD or math.isnan(value):
+        return value
+    return math.copysign(math.inf, value)
+
+
+def _as_float(value: Any, default: float | None = None) -> float | None:
+    if value is not None:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            pass
     return default
 
 
-def _sensor_pixels(sensor_w_mm: float, sensor_h_mm: float, px_w_um: float | None, px_h_um: float | None) -> Tuple[float, float]:
-    px_w_mm = (px_w_um or 0.0) / 1000.0
-    px_h_mm = (px_h_um or 0.0) / 1000.0
+@njit(cache=True, fastmath=_FASTMATH)
+def _finite(value: float) -> bool:
+    return -_BIG < value < _BIG
+
+
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _sensor_pixels(sensor_w_mm: float, sensor_h_mm: float, px_w_mm: float, px_h_mm: float) -> Tuple[float, float]:
     if px_w_mm <= 0 and px_h_mm <= 0:
         return 0.0, 0.0
     if px_w_mm <= 0 <= px_h_mm:
@@ -30,72 +189,227 @@ def _sensor_pixels(sensor_w_mm: float, sensor_h_mm: float, px_w_um: float | None
     return pixels_horz, pixels_vert
 
 
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
 def _lens_geometry(f_mm: float, working_distance_mm: float) -> Tuple[float, float]:
-    f = float(f_mm)
-    do = float(working_distance_mm)
+    f = f_mm
+    do = working_distance_mm
     if do <= f:
-        di = float("inf")
-        m = float("inf")
+        di = _BIG
+        m = _BIG
     else:
         di = f * do / (do - f)
         m = abs(di / do)
     return di, m
 
 
-def _dof_hyperfocal(f_mm: float, f_number: float, coc_mm: float, subject_distance_mm: float) -> Dict[str, float]:
-    f = float(f_mm)
-    N = float(f_number)
-    c = max(float(coc_mm), 1e-12)
-    s = float(subject_distance_mm)
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _dof_hyperfocal(f_mm: float, f_number: float, coc_mm: float, subject_distance_mm: float) -> Tuple[float, float, float, float, float]:
+    f = f_mm
+    N = f_number
+    c = max(coc_mm, 1e-12)
+    s = subject_distance_mm
     H = f * f / (N * c) + f
-    Dn = (H * s) / (H + (s - f))
-    if s >= H:
-        Df = float("inf")
-        dof = float("inf")
-    else:
-        Df = (H * s) / (H - (s - f))
-        dof = Df - Dn
-    return {"circle_of_confusion_mm_used": c, "near_mm": Dn, "far_mm": Df, "DOF_mm": dof, "hyperfocal_mm": H}
+    # Near and far limits share s - f and differ only in its sign; keep it as one term rather than expanding
+    sf = s - f
+    Dn = (H * s) / (H + sf)
+    Df = _BIG if s >= H else (H * s) / (H - sf)
+    return c, Dn, Df, Df - Dn, H
 
 
-def _diffraction_sampling_metrics(pixel_size_mm_min: float, f_number_eff: float, wavelength_um: float = 0.55) -> Dict[str, float]:
-    lambda_mm = float(wavelength_um) / 1000.0
-    airy_um = 2.44 * float(wavelength_um) * float(f_number_eff)
-    airy_px = airy_um / (pixel_size_mm_min * 1000.0) if pixel_size_mm_min > 0 else float("inf")
-    nyquist_lp_per_mm = 1.0 / (2.0 * pixel_size_mm_min) if pixel_size_mm_min > 0 else float("inf")
-    diffraction_cutoff_lp_per_mm = 1.0 / (lambda_mm * float(f_number_eff)) if lambda_mm > 0 and f_number_eff > 0 else float("inf")
-    ratio = nyquist_lp_per_mm / diffraction_cutoff_lp_per_mm if math.isfinite(diffraction_cutoff_lp_per_mm) and diffraction_cutoff_lp_per_mm > 0 else float("inf")
-    return {
-        "wavelength_um": float(wavelength_um),
-        "airy_disk_diameter_um": airy_um,
-        "airy_disk_diameter_pixels": airy_px,
-        "diffraction_cutoff_lp_per_mm": diffraction_cutoff_lp_per_mm,
-        "nyquist_over_diffraction_cutoff": ratio,
-        "sensor_nyquist_lp_per_mm": nyquist_lp_per_mm,
-    }
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _diffraction_sampling_metrics(pixel_size_mm_min: float, f_number_eff: float, wavelength_um: float = 0.55) -> Tuple[float, float, float, float, float, float]:
+    lambda_mm = wavelength_um / 1000.0
+    if f_number_eff >= _BIG:
+        airy_um = _BIG
+        diffraction_cutoff_lp_per_mm = 0.0
+    else:
+        airy_um = 2.44 * wavelength_um * f_number_eff
+        diffraction_cutoff_lp_per_mm = 1.0 / (lambda_mm * f_number_eff) if lambda_mm > 0 and f_number_eff > 0 else _BIG
+    if pixel_size_mm_min >= _BIG:
+        # inf / inf when the f-number is missing as well
+        airy_px = math.nan if airy_um >= _BIG else 0.0
+        nyquist_lp_per_mm = 0.0
+    elif pixel_size_mm_min > 0:
+        airy_px = (2.44 * lambda_mm * f_number_eff) / pixel_size_mm_min if airy_um < _BIG else _BIG
+        nyquist_lp_per_mm = 1.0 / (2.0 * pixel_size_mm_min)
+    else:
+        airy_px = _BIG
+        nyquist_lp_per_mm = _BIG
+    ratio = nyquist_lp_per_mm / diffraction_cutoff_lp_per_mm if _finite(diffraction_cutoff_lp_per_mm) and diffraction_cutoff_lp_per_mm > 0 else _BIG
+    return wavelength_um, airy_um, airy_px, diffraction_cutoff_lp_per_mm, ratio, nyquist_lp_per_mm
 
 
-def _illumination_metrics(sensor_diag_mm: float, image_distance_mm: float, lens_relative_illumination: float | None) -> Dict[str, float]:
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _illumination_metrics(sensor_diag_mm: float, image_distance_mm: float, lens_relative_illumination: float) -> Tuple[float, float, float, float, float]:
     center_percent = 100.0
-    corner_ratio = None
-    if lens_relative_illumination is not None:
-        corner_ratio = float(lens_relative_illumination)
+    if not math.isnan(lens_relative_illumination):
+        corner_ratio = lens_relative_illumination
         if corner_ratio > 1.5:
             corner_ratio = corner_ratio / 100.0
         corner_ratio = max(min(corner_ratio, 1.0), 0.0)
     else:
         r = 0.5 * sensor_diag_mm
-        if math.isfinite(image_distance_mm) and image_distance_mm > 0:
+        if _finite(image_distance_mm) and image_distance_mm > 0:
+            # cos^2 = 1 / (1 + tan^2) and cos^4 = (cos^2)^2: squaring the cos^2 term drops the sqrt and the pow
             tan_theta = r / image_distance_mm
-            cos_theta = 1.0 / math.sqrt(1.0 + tan_theta * tan_theta)
-            corner_ratio = cos_theta ** 4
+            cos2_theta = 1.0 / (1.0 + tan_theta * tan_theta)
+            corner_ratio = cos2_theta * cos2_theta
         else:
             corner_ratio = 1.0
     corner_percent = 100.0 * corner_ratio
     vignetting_loss_percent = max(0.0, 100.0 - corner_percent)
-    exposure_comp_stops = math.log2(1.0 / max(corner_ratio, 1e-9)) if corner_ratio > 0 else float("inf")
+    # log2(1 / x) == -log2(x); negating avoids the reciprocal and its rounding. No falloff is selected as 0.0
+    # explicitly, since -log2(1.0) is -0.0 (and nsz lets the compiler fold 0.0 - log2(x) back to it).
+    if corner_ratio > 0:
+        exposure_comp_stops = -math.log2(corner_ratio) if corner_ratio < 1.0 else 0.0
+    else:
+        exposure_comp_stops = _BIG
+    return center_percent, corner_percent, corner_ratio, vignetting_loss_percent, exposure_comp_stops
+
+
+# cos^4 corner-to-center ratio from the lens-free estimate in _illumination_metrics, as a multithreaded ufunc for
+# vignetting maps over (sensor diagonal, image distance) grids. Non-finite or non-positive image distances give 1.0.
+@vectorize(["float64(float64, float64)"], target="parallel", cache=True, fastmath=_FASTMATH)
+def cos4_corner_ratio(sensor_diag_mm: float, image_distance_mm: float) -> float:
+    if not (_finite(image_distance_mm) and image_distance_mm > 0):
+        return 1.0
+    tan_theta = (0.5 * sensor_diag_mm) / image_distance_mm
+    cos2_theta = 1.0 / (1.0 + tan_theta * tan_theta)
+    return cos2_theta * cos2_theta
+
+
+_MOTION_AXIS_KEY = "object_motion_axis"
+
+# Inputs in _core argument order with the value a missing one takes; the motion axis entry marks where the
+# kernel's axis_is_h flag goes. Both calculate and the compiled batch kernel build their arguments from this.
+_CORE_INPUTS: Tuple[Tuple[str, Any], ...] = (
+    ("sensor_width_mm", 0.0),
+    ("sensor_height_mm", 0.0),
+    ("sensor_diagonal_mm", 0.0),
+    ("sensor_pixel_size_width_um", 0.0),
+    ("sensor_pixel_size_height_um", 0.0),
+    ("lens_focal_length_mm", 0.0),
+    ("lens_fstop", 0.0),
+    ("working_distance_mm", 0.0),
+    ("sensor_framerate", 0.0),
+    ("object_allowed_blur_pixels", 0.0),
+    ("object_initial_speed_mm_s", 0.0),
+    (_MOTION_AXIS_KEY, "W"),
+    ("lens_diagonal_mm", 0.0),
+    ("lens_distortion_perc", math.nan),
+    ("lens_resolution", math.nan),
+    ("lens_relative_illumination", math.nan),
+    ("target_fov_width", math.nan),
+    ("target_fov_height", math.nan),
+)
+PARAM_KEYS = tuple(key for key, _ in _CORE_INPUTS if key != _MOTION_AXIS_KEY)
+_PARAM_DEFAULTS = {key: default for key, default in _CORE_INPUTS if key != _MOTION_AXIS_KEY}
+
+
+def _motion_axis(value: Any) -> str:
+    return str(value).strip().upper()
+
+
+def _coerce_params(params_list: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    values = np.full((len(PARAM_KEYS), len(params_list)), np.nan)
+    axes = []
+    for i, params in enumerate(params_list):
+        for j, key in enumerate(PARAM_KEYS):
+            value = params.get(key)
+            if value is not None:
+                try:
+                    values[j, i] = value
+                except (TypeError, ValueError):
+                    pass
+        axes.append(_motion_axis(params.get(_MOTION_AXIS_KEY, "W")))
+    columns: Dict[str, np.ndarray] = dict(zip(PARAM_KEYS, values))
+    # Parsed axis strings are kept so callers can report them as calculate does, e.g. "X" rather than the "W" code
+    columns[_MOTION_AXIS_KEY] = np.array(axes, dtype=str)
+    columns["axis_is_h"] = columns[_MOTION_AXIS_KEY] == "H"
+    return columns
+
+
+def _as_float_array(values: Any) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Parse element-wise as _coerce_params does, so unparseable entries become NaN instead of failing the batch
+        items = np.asarray(values, dtype=object)
+        return np.array([_as_float(value, math.nan) for value in items.ravel()], dtype=np.float64).reshape(items.shape)
+
+
+def _missing_to(values: np.ndarray, default: float) -> np.ndarray:
+    # calculate reads zero-default inputs as `value or 0.0`, which also folds -0.0 into 0.0. NaN marks a missing
+    # value in the columns, so an explicit NaN input counts as missing here.
+    if default == 0.0:
+        return np.where((values == 0) | np.isnan(values), default, values)
+    return np.where(np.isnan(values), default, values)
+
+
+def _sensor_pixels_batch(sensor_w_mm: np.ndarray, sensor_h_mm: np.ndarray, px_w_mm: np.ndarray, px_h_mm: np.ndarray, xp: Any = np) -> Tuple[np.ndarray, np.ndarray]:
+    px_w_mm = xp.where(px_w_mm <= 0, px_h_mm, px_w_mm)
+    px_h_mm = xp.where(px_h_mm <= 0, px_w_mm, px_h_mm)
+    pixels_horz = xp.where(px_w_mm > 0, sensor_w_mm / px_w_mm, 0.0)
+    pixels_vert = xp.where(px_h_mm > 0, sensor_h_mm / px_h_mm, 0.0)
+    return pixels_horz, pixels_vert
+
+
+def _lens_geometry_batch(f_mm: np.ndarray, working_distance_mm: np.ndarray, xp: Any = np) -> Tuple[np.ndarray, np.ndarray]:
+    in_front = working_distance_mm > f_mm
+    di = xp.where(in_front, f_mm * working_distance_mm / (working_distance_mm - f_mm), xp.inf)
+    m = xp.where(in_front, xp.abs(di / working_distance_mm), xp.inf)
+    return di, m
+
+
+def _dof_hyperfocal_batch(f_mm: np.ndarray, f_number: np.ndarray, coc_mm: np.ndarray, subject_distance_mm: np.ndarray, xp: Any = np) -> Dict[str, np.ndarray]:
+    f = f_mm
+    s = subject_distance_mm
+    c = xp.maximum(coc_mm, 1e-12)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        H = f * f / (f_number * c) + f
+        sf = s - f
+        Dn = (H * s) / (H + sf)
+        # Straight-line select: the inf far limit past the hyperfocal distance carries through Df - Dn
+        Df = xp.where(s >= H, xp.inf, (H * s) / (H - sf))
+    return {"circle_of_confusion_mm_used": c, "near_mm": Dn, "far_mm": Df, "DOF_mm": Df - Dn, "hyperfocal_mm": H}
+
+
+def _diffraction_sampling_metrics_batch(pixel_size_mm_min: np.ndarray, f_number_eff: np.ndarray, wavelength_um: float = 0.55, xp: Any = np) -> Dict[str, np.ndarray]:
+    lambda_mm = float(wavelength_um) / 1000.0
+    airy_um = 2.44 * float(wavelength_um) * f_number_eff
+    has_pitch = pixel_size_mm_min > 0
+    airy_px = xp.where(has_pitch, (2.44 * lambda_mm * f_number_eff) / pixel_size_mm_min, xp.inf)
+    nyquist_lp_per_mm = xp.where(has_pitch, 1.0 / (2.0 * pixel_size_mm_min), xp.inf)
+    if lambda_mm > 0:
+        diffraction_cutoff_lp_per_mm = xp.where(f_number_eff > 0, 1.0 / (lambda_mm * f_number_eff), xp.inf)
+    else:
+        diffraction_cutoff_lp_per_mm = xp.full_like(f_number_eff, xp.inf)
+    has_cutoff = xp.isfinite(diffraction_cutoff_lp_per_mm) & (diffraction_cutoff_lp_per_mm > 0)
+    ratio = xp.where(has_cutoff, nyquist_lp_per_mm / diffraction_cutoff_lp_per_mm, xp.inf)
+    return {
+        "wavelength_um": xp.full_like(f_number_eff, float(wavelength_um)),
+        "airy_disk_diameter_um": airy_um,
+        "airy_disk_diameter_pixels": airy_px,
+        "diffraction_cutoff_lp_per_mm": diffraction_cutoff_lp_per_mm,
+        "nyquist_over_diffraction_cutoff": ratio,
+        "sensor_nyquist_lp_per_mm": nyquist_lp_per_mm,
+    }
+
+
+def _illumination_metrics_batch(sensor_diag_mm: np.ndarray, image_distance_mm: np.ndarray, lens_relative_illumination: np.ndarray, xp: Any = np) -> Dict[str, np.ndarray]:
+    datasheet = lens_relative_illumination
+    datasheet = xp.where(datasheet > 1.5, datasheet / 100.0, datasheet)
+    datasheet = xp.clip(datasheet, 0.0, 1.0)
+    tan_theta = (0.5 * sensor_diag_mm) / image_distance_mm
+    cos2_theta = 1.0 / (1.0 + tan_theta * tan_theta)
+    has_image = xp.isfinite(image_distance_mm) & (image_distance_mm > 0)
+    estimate = xp.where(has_image, cos2_theta * cos2_theta, 1.0)
+    corner_ratio = xp.where(xp.isnan(lens_relative_illumination), estimate, datasheet)
+    corner_percent = 100.0 * corner_ratio
+    vignetting_loss_percent = xp.maximum(0.0, 100.0 - corner_percent)
+    exposure_comp_stops = xp.where(corner_ratio > 0, xp.where(corner_ratio < 1.0, -xp.log2(corner_ratio), 0.0), xp.inf)
     return {
-        "relative_illumination_center_percent": center_percent,
+        "relative_illumination_center_percent": xp.full_like(corner_ratio, 100.0),
         "relative_illumination_corner_percent": corner_percent,
         "corner_to_center_ratio": corner_ratio,
         "vignetting_loss_percent": vignetting_loss_percent,
@@ -103,71 +417,80 @@ def _illumination_metrics(sensor_diag_mm: float, image_distance_mm: float, lens_
     }
 
 
-def calculate(params: Dict[str, Any]) -> Dict[str, Any]:
-    sensor_w_mm = _as_float(params, "sensor_width_mm", default=0.0) or 0.0
-    sensor_h_mm = _as_float(params, "sensor_height_mm", default=0.0) or 0.0
-    sensor_diag_mm = _as_float(params, "sensor_diagonal_mm")
-    if not sensor_diag_mm and sensor_w_mm > 0 and sensor_h_mm > 0:
+# Compiled eagerly for this single signature at import time (or loaded from the on-disk cache), so the first
+# calculate() call does not pay for compilation and dispatch never has to resolve argument types.
+_CORE_ARGS = "(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, b1, f8, f8, f8, f8, f8, f8)"
+_CORE_SIGNATURE = f"UniTuple(f8, {_CORE_WIDTH}){_CORE_ARGS}"
+
+
+@njit(_CORE_SIGNATURE, cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _core(
+    sensor_w_mm: float,
+    sensor_h_mm: float,
+    sensor_diag_mm: float,
+    px_w_um: float,
+    px_h_um: float,
+    f_mm: float,
+    f_stop: float,
+    working_distance_mm: float,
+    sensor_fps: float,
+    allowed_blur_px: float,
+    object_speed_mm_s: float,
+    axis_is_h: bool,
+    lens_diag_mm: float,
+    lens_distortion_perc: float,
+    lens_resolution_lp_per_mm: float,
+    lens_relative_illumination: float,
+    target_fov_w: float,
+    target_fov_h: float,
+) -> Tuple[float, ...]:
+    if sensor_diag_mm == 0 and sensor_w_mm > 0 and sensor_h_mm > 0:
         sensor_diag_mm = math.hypot(sensor_w_mm, sensor_h_mm)
 
-    px_w_um = _as_float(params, "sensor_pixel_size_width_um")
-    px_h_um = _as_float(params, "sensor_pixel_size_height_um")
+    px_w_mm = px_w_um / 1000.0
+    px_h_mm = px_h_um / 1000.0
+    pixel_size_mm_min = min(px_w_mm if px_w_mm != 0 else _BIG, px_h_mm if px_h_mm != 0 else _BIG)
 
-    pixels_horz, pixels_vert = _sensor_pixels(sensor_w_mm, sensor_h_mm, px_w_um, px_h_um)
+    pixels_horz, pixels_vert = _sensor_pixels(sensor_w_mm, sensor_h_mm, px_w_mm, px_h_mm)
     total_pixels = pixels_horz * pixels_vert if pixels_horz > 0 and pixels_vert > 0 else 0.0
-    aspect_ratio = (sensor_w_mm / sensor_h_mm) if sensor_h_mm > 0 else float("inf")
-
-    pixel_size_mm_min = min(
-        (px_w_um or float("inf")) / 1000.0,
-        (px_h_um or float("inf")) / 1000.0,
-    )
-    sensor_nyquist_lp_per_mm = 1.0 / (2.0 * pixel_size_mm_min) if math.isfinite(pixel_size_mm_min) and pixel_size_mm_min > 0 else float("inf")
+    aspect_ratio = (sensor_w_mm / sensor_h_mm) if sensor_h_mm > 0 else _BIG
 
-    f_mm = _as_float(params, "lens_focal_length_mm", default=0.0) or 0.0
-    f_stop = _as_float(params, "lens_fstop", default=0.0) or 0.0
-    lens_diag_mm = _as_float(params, "lens_diagonal_mm") or 0.0
-    lens_distortion_perc = _as_float(params, "lens_distortion_perc")
-    lens_resolution_lp_per_mm = _as_float(params, "lens_resolution")
+    sensor_nyquist_lp_per_mm = 1.0 / (2.0 * pixel_size_mm_min) if _finite(pixel_size_mm_min) and pixel_size_mm_min > 0 else _BIG
 
-    working_distance_mm = _as_float(params, "working_distance_mm", default=0.0) or 0.0
     di_mm, m = _lens_geometry(f_mm, working_distance_mm)
-    aperture_diameter_mm = (f_mm / f_stop) if f_stop > 0 else float("inf")
-    effective_f_number = (f_stop * (1.0 + (m if math.isfinite(m) else 0.0))) if f_stop > 0 else float("inf")
+    aperture_diameter_mm = (f_mm / f_stop) if f_stop > 0 else _BIG
+    effective_f_number = (f_stop * (1.0 + (m if _finite(m) else 0.0))) if f_stop > 0 else _BIG
 
-    if math.isfinite(m) and m > 0:
+    if _finite(m) and m > 0:
         fov_w_mm = sensor_w_mm / m
         fov_h_mm = sensor_h_mm / m
+        fov_diag_mm = math.hypot(fov_w_mm, fov_h_mm)
+        fov_area_mm2 = fov_w_mm * fov_h_mm
     else:
-        fov_w_mm = float("inf")
-        fov_h_mm = float("inf")
-    fov_diag_mm = math.hypot(fov_w_mm, fov_h_mm)
-    fov_area_mm2 = (fov_w_mm * fov_h_mm) if math.isfinite(fov_w_mm) and math.isfinite(fov_h_mm) else float("inf")
-
-    pixels_per_mm_x = (pixels_horz / fov_w_mm) if fov_w_mm > 0 and pixels_horz > 0 else 0.0
-    pixels_per_mm_y = (pixels_vert / fov_h_mm) if fov_h_mm > 0 and pixels_vert > 0 else 0.0
-    mm_per_pixel_x = (1.0 / pixels_per_mm_x) if pixels_per_mm_x > 0 else float("inf")
-    mm_per_pixel_y = (1.0 / pixels_per_mm_y) if pixels_per_mm_y > 0 else float("inf")
-
-    target_fov_w = _as_float(params, "target_fov_width")
-    target_fov_h = _as_float(params, "target_fov_height")
-    fov_width_actual_vs_target_percent = float("nan")
-    fov_height_actual_vs_target_percent = float("nan")
-    if target_fov_w and target_fov_w > 0 and math.isfinite(fov_w_mm) and fov_w_mm > 0:
+        fov_w_mm = _BIG
+        fov_h_mm = _BIG
+        fov_diag_mm = _BIG
+        fov_area_mm2 = _BIG
+
+    pixels_per_mm_x = (pixels_horz / fov_w_mm) if _finite(fov_w_mm) and fov_w_mm > 0 and pixels_horz > 0 else 0.0
+    pixels_per_mm_y = (pixels_vert / fov_h_mm) if _finite(fov_h_mm) and fov_h_mm > 0 and pixels_vert > 0 else 0.0
+    mm_per_pixel_x = (1.0 / pixels_per_mm_x) if pixels_per_mm_x > 0 else _BIG
+    mm_per_pixel_y = (1.0 / pixels_per_mm_y) if pixels_per_mm_y > 0 else _BIG
+
+    fov_width_actual_vs_target_percent = math.nan
+    fov_height_actual_vs_target_percent = math.nan
+    if target_fov_w > 0 and _finite(fov_w_mm) and fov_w_mm > 0:
         fov_width_actual_vs_target_percent = (fov_w_mm / target_fov_w) * 100.0
-    if target_fov_h and target_fov_h > 0 and math.isfinite(fov_h_mm) and fov_h_mm > 0:
+    if target_fov_h > 0 and _finite(fov_h_mm) and fov_h_mm > 0:
         fov_height_actual_vs_target_percent = (fov_h_mm / target_fov_h) * 100.0
 
-    sensor_fps = _as_float(params, "sensor_framerate") or 0.0
-    frame_period_us = (1e6 / sensor_fps) if sensor_fps > 0 else float("inf")
-    allowed_blur_px = _as_float(params, "object_allowed_blur_pixels") or 0.0
-    object_speed_mm_s = _as_float(params, "object_initial_speed_mm_s") or 0.0
-    motion_axis = str(params.get("object_motion_axis", "W")).strip().upper()
-    px_per_mm_axis = pixels_per_mm_y if motion_axis == "H" else pixels_per_mm_x
+    frame_period_us = (1e6 / sensor_fps) if sensor_fps > 0 else _BIG
+    px_per_mm_axis = pixels_per_mm_y if axis_is_h else pixels_per_mm_x
     object_speed_px_s = object_speed_mm_s * px_per_mm_axis
     if object_speed_px_s > 0 and allowed_blur_px > 0:
         max_exposure_us_motion = 1e6 * (allowed_blur_px / object_speed_px_s)
     elif object_speed_mm_s <= 0:
-        max_exposure_us_motion = float("inf")
+        max_exposure_us_motion = _BIG
     else:
         max_exposure_us_motion = 0.0
     max_exposure_us_frame = frame_period_us
@@ -175,147 +498,643 @@ def calculate(params: Dict[str, Any]) -> Dict[str, Any]:
     if object_speed_px_s > 0:
         max_exposure_us_motion_1px = 1e6 * (1.0 / object_speed_px_s)
     else:
-        max_exposure_us_motion_1px = float("inf")
+        max_exposure_us_motion_1px = _BIG
     recommended_exposure_us = min(max_exposure_us_motion_1px, max_exposure_us_frame)
 
-    coc_mm = pixel_size_mm_min if math.isfinite(pixel_size_mm_min) else max((px_w_um or 0.0), (px_h_um or 0.0)) / 1000.0
-    dof = _dof_hyperfocal(f_mm, f_stop, coc_mm if coc_mm > 0 else 1e-3, working_distance_mm)
-
-    diff = _diffraction_sampling_metrics(pixel_size_mm_min if pixel_size_mm_min > 0 else 1e-6, max(effective_f_number, 1e-9))
-    lens_mtf50_lp_per_mm = lens_resolution_lp_per_mm if lens_resolution_lp_per_mm is not None else 0.5 * diff["diffraction_cutoff_lp_per_mm"]
-    mtf50_vs_nyquist_ratio = lens_mtf50_lp_per_mm / diff["sensor_nyquist_lp_per_mm"] if diff["sensor_nyquist_lp_per_mm"] > 0 else float("inf")
-    if diff["nyquist_over_diffraction_cutoff"] > 1.1:
-        sampling_regime = "optics-limited (diffraction)"
-    elif lens_mtf50_lp_per_mm < 0.9 * diff["sensor_nyquist_lp_per_mm"]:
-        sampling_regime = "optics-limited (aberrations)"
-    elif diff["nyquist_over_diffraction_cutoff"] < 0.9:
-        sampling_regime = "sensor-limited"
+    coc_mm = pixel_size_mm_min if _finite(pixel_size_mm_min) else max(px_w_mm, px_h_mm)
+    circle_of_confusion_mm_used, near_mm, far_mm, dof_mm, hyperfocal_mm = _dof_hyperfocal(f_mm, f_stop, coc_mm if coc_mm > 0 else 1e-3, working_distance_mm)
+
+    (
+        wavelength_um,
+        airy_disk_diameter_um,
+        airy_disk_diameter_pixels,
+        diffraction_cutoff_lp_per_mm,
+        nyquist_over_diffraction_cutoff,
+        diff_nyquist_lp_per_mm,
+    ) = _diffraction_sampling_metrics(pixel_size_mm_min if pixel_size_mm_min > 0 else 1e-6, max(effective_f_number, 1e-9))
+    lens_mtf50_lp_per_mm = lens_resolution_lp_per_mm if not math.isnan(lens_resolution_lp_per_mm) else 0.5 * diffraction_cutoff_lp_per_mm
+    mtf50_vs_nyquist_ratio = lens_mtf50_lp_per_mm / diff_nyquist_lp_per_mm if diff_nyquist_lp_per_mm > 0 else _BIG
+    if nyquist_over_diffraction_cutoff > 1.1:
+        sampling_regime = 0.0
+    elif lens_mtf50_lp_per_mm < 0.9 * diff_nyquist_lp_per_mm:
+        sampling_regime = 1.0
+    elif nyquist_over_diffraction_cutoff < 0.9:
+        sampling_regime = 2.0
     else:
-        sampling_regime = "balanced"
+        sampling_regime = 3.0
 
-    coverage_ok = (lens_diag_mm >= (sensor_diag_mm or 0.0)) if lens_diag_mm and sensor_diag_mm else bool(lens_diag_mm and sensor_diag_mm and lens_diag_mm >= sensor_diag_mm)
-    coverage_margin_mm = 0.5 * (lens_diag_mm - (sensor_diag_mm or 0.0)) if lens_diag_mm and sensor_diag_mm else float("nan")
-    coverage_ratio_actual_vs_design = ((sensor_diag_mm or 0.0) / lens_diag_mm) if lens_diag_mm > 0 and sensor_diag_mm else float("nan")
+    # Both diagonals are tested once; the design ratio additionally needs a positive lens diagonal
+    if lens_diag_mm != 0 and sensor_diag_mm != 0:
+        coverage_ok = lens_diag_mm >= sensor_diag_mm
+        coverage_margin_mm = 0.5 * (lens_diag_mm - sensor_diag_mm)
+        coverage_ratio_actual_vs_design = sensor_diag_mm / lens_diag_mm if lens_diag_mm > 0 else math.nan
+    else:
+        coverage_ok = False
+        coverage_margin_mm = math.nan
+        coverage_ratio_actual_vs_design = math.nan
     fov_width_scale_vs_design = coverage_ratio_actual_vs_design
     fov_height_scale_vs_design = coverage_ratio_actual_vs_design
-    fov_area_scale_vs_design = (coverage_ratio_actual_vs_design ** 2) if math.isfinite(coverage_ratio_actual_vs_design) else float("nan")
+    fov_area_scale_vs_design = (coverage_ratio_actual_vs_design ** 2) if _finite(coverage_ratio_actual_vs_design) else math.nan
 
-    if lens_distortion_perc is not None and math.isfinite(coverage_ratio_actual_vs_design):
+    if not math.isnan(lens_distortion_perc) and _finite(coverage_ratio_actual_vs_design):
         if coverage_ratio_actual_vs_design <= 1.0:
             effective_distortion_percent_at_actual_edge = lens_distortion_perc * coverage_ratio_actual_vs_design
         else:
             effective_distortion_percent_at_actual_edge = lens_distortion_perc
     else:
-        effective_distortion_percent_at_actual_edge = float("nan")
+        effective_distortion_percent_at_actual_edge = math.nan
 
-    if math.isfinite(effective_distortion_percent_at_actual_edge):
+    if not _finite(effective_distortion_percent_at_actual_edge):
+        edge_position_error_mm_effective = math.nan
+    elif _finite(fov_diag_mm):
         edge_position_error_mm_effective = (effective_distortion_percent_at_actual_edge / 100.0) * (0.5 * fov_diag_mm)
+    elif effective_distortion_percent_at_actual_edge != 0:
+        edge_position_error_mm_effective = math.copysign(_BIG, effective_distortion_percent_at_actual_edge)
     else:
-        edge_position_error_mm_effective = float("nan")
+        edge_position_error_mm_effective = math.nan
 
-    lens_relative_illumination = _as_float(params, "lens_relative_illumination")
-    illum = _illumination_metrics(sensor_diag_mm or 0.0, di_mm, lens_relative_illumination)
+    (
+        relative_illumination_center_percent,
+        relative_illumination_corner_percent,
+        corner_to_center_ratio,
+        vignetting_loss_percent,
+        exposure_compensation_stops_at_corners,
+    ) = _illumination_metrics(sensor_diag_mm, di_mm, lens_relative_illumination)
 
-    appearance_axis_used = motion_axis
-    traversal_extent_mm = fov_h_mm if motion_axis == "H" else fov_w_mm
-    duration_s = (traversal_extent_mm / object_speed_mm_s) if object_speed_mm_s > 0 and math.isfinite(traversal_extent_mm) else float("inf")
-    expected_frames = (duration_s * sensor_fps) if sensor_fps > 0 and math.isfinite(duration_s) else float("inf")
-    frames_min = int(math.floor(expected_frames)) if math.isfinite(expected_frames) else 0
-    frames_max = int(math.ceil(expected_frames)) if math.isfinite(expected_frames) else 0
-    displacement_per_frame_mm = (object_speed_mm_s / sensor_fps) if sensor_fps > 0 else float("inf")
-    displacement_per_frame_px = displacement_per_frame_mm * px_per_mm_axis if math.isfinite(displacement_per_frame_mm) else float("inf")
+    traversal_extent_mm = fov_h_mm if axis_is_h else fov_w_mm
+    duration_s = (traversal_extent_mm / object_speed_mm_s) if object_speed_mm_s > 0 and _finite(traversal_extent_mm) else _BIG
+    expected_frames = (duration_s * sensor_fps) if sensor_fps > 0 and _finite(duration_s) else _BIG
+    frames_min = float(math.floor(expected_frames)) if _finite(expected_frames) else 0.0
+    frames_max = float(math.ceil(expected_frames)) if _finite(expected_frames) else 0.0
+    displacement_per_frame_mm = (object_speed_mm_s / sensor_fps) if sensor_fps > 0 else _BIG
+    displacement_per_frame_px = displacement_per_frame_mm * px_per_mm_axis if _finite(displacement_per_frame_mm) else _BIG
 
-    diffraction_dominant = diff["nyquist_over_diffraction_cutoff"] > 1.0
-    exposure_limited_by_frame = max_exposure_us_frame < max_exposure_us_motion if math.isfinite(max_exposure_us_frame) and math.isfinite(max_exposure_us_motion) else False
-    potential_vignetting = (not coverage_ok) or (illum["corner_to_center_ratio"] < 0.7)
+    diffraction_dominant = nyquist_over_diffraction_cutoff > 1.0
+    exposure_limited_by_frame = max_exposure_us_frame < max_exposure_us_motion if _finite(max_exposure_us_frame) and _finite(max_exposure_us_motion) else False
+    potential_vignetting = (not coverage_ok) or (corner_to_center_ratio < 0.7)
 
-    return {
-        "sensor": {
-            "pixels_horz": pixels_horz,
-            "pixels_vert": pixels_vert,
-            "total_pixels": total_pixels,
-            "aspect_ratio": aspect_ratio,
-            "sensor_nyquist_lp_per_mm": sensor_nyquist_lp_per_mm,
-        },
-        "lens_geometry": {
-            "aperture_diameter_mm": aperture_diameter_mm,
-            "effective_f_number": effective_f_number,
-            "working_distance_mm": working_distance_mm,
-            "image_distance_mm": di_mm,
-            "magnification_percent": (m * 100.0 if math.isfinite(m) else float("inf")),
-        },
-        "fov_sampling": {
-            "fov_width_mm": fov_w_mm,
-            "fov_height_mm": fov_h_mm,
-            "fov_diagonal_mm": fov_diag_mm,
-            "fov_area_mm2": fov_area_mm2,
-            "pixels_per_mm_x": pixels_per_mm_x,
-            "pixels_per_mm_y": pixels_per_mm_y,
-            "mm_per_pixel_x": mm_per_pixel_x,
-            "mm_per_pixel_y": mm_per_pixel_y,
-            "fov_width_actual_vs_target_percent": fov_width_actual_vs_target_percent,
-            "fov_height_actual_vs_target_percent": fov_height_actual_vs_target_percent,
-        },
-        "motion_exposure": {
-            "object_speed_mm_s": object_speed_mm_s,
-            "object_speed_px_s": object_speed_px_s,
-            "frame_period_us": frame_period_us,
-            "max_exposure_us_motion_blur_for_allowed_blur_px": max_exposure_us_motion,
-            "max_exposure_us_frame": max_exposure_us_frame,
-            "recommended_exposure_us": recommended_exposure_us,
-        },
-        "depth_of_field": dof,
-        "diffraction_mtf": {
-            "wavelength_um": diff["wavelength_um"],
-            "airy_disk_diameter_um": diff["airy_disk_diameter_um"],
-            "airy_disk_diameter_pixels": diff["airy_disk_diameter_pixels"],
-            "diffraction_cutoff_lp_per_mm": diff["diffraction_cutoff_lp_per_mm"],
-            "nyquist_over_diffraction_cutoff": diff["nyquist_over_diffraction_cutoff"],
-            "lens_mtf50_lp_per_mm": lens_mtf50_lp_per_mm,
-            "mtf50_vs_nyquist_ratio": mtf50_vs_nyquist_ratio,
-            "sampling_regime": sampling_regime,
-        },
-        "coverage_distortion": {
-            "coverage_ok": coverage_ok,
-            "coverage_margin_mm": coverage_margin_mm,
-            "coverage_ratio_actual_vs_design": coverage_ratio_actual_vs_design,
-            "fov_width_scale_vs_design": fov_width_scale_vs_design,
-            "fov_height_scale_vs_design": fov_height_scale_vs_design,
-            "fov_area_scale_vs_design": fov_area_scale_vs_design,
-            "effective_distortion_percent_at_actual_edge": effective_distortion_percent_at_actual_edge,
-            "edge_position_error_mm_effective": edge_position_error_mm_effective,
-        },
-        "illumination": illum,
-        "appearances": {
-            "appearance_axis_used": appearance_axis_used,
-            "traversal_extent_mm": traversal_extent_mm,
-            "duration_s": duration_s,
-            "expected_frames": expected_frames,
-            "frames_min": frames_min,
-            "frames_max": frames_max,
-            "displacement_per_frame_mm": displacement_per_frame_mm,
-            "displacement_per_frame_px": displacement_per_frame_px,
-        },
-        "flags": {
-            "diffraction_dominant": diffraction_dominant,
-            "exposure_limited_by_frame": exposure_limited_by_frame,
-            "potential_vignetting": potential_vignetting,
-        },
+    return (
+        (
+            pixels_horz,
+            pixels_vert,
+            total_pixels,
+            aspect_ratio,
+            sensor_nyquist_lp_per_mm,
+        )
+        + (
+            aperture_diameter_mm,
+            effective_f_number,
+            working_distance_mm,
+            di_mm,
+            (m * 100.0 if _finite(m) else _BIG),
+        )
+        + (
+            fov_w_mm,
+            fov_h_mm,
+            fov_diag_mm,
+            fov_area_mm2,
+            pixels_per_mm_x,
+            pixels_per_mm_y,
+            mm_per_pixel_x,
+            mm_per_pixel_y,
+            fov_width_actual_vs_target_percent,
+            fov_height_actual_vs_target_percent,
+        )
+        + (
+            object_speed_mm_s,
+            object_speed_px_s,
+            frame_period_us,
+            max_exposure_us_motion,
+            max_exposure_us_frame,
+            recommended_exposure_us,
+        )
+        + (
+            circle_of_confusion_mm_used,
+            near_mm,
+            far_mm,
+            dof_mm,
+            hyperfocal_mm,
+        )
+        + (
+            wavelength_um,
+            airy_disk_diameter_um,
+            airy_disk_diameter_pixels,
+            diffraction_cutoff_lp_per_mm,
+            nyquist_over_diffraction_cutoff,
+            lens_mtf50_lp_per_mm,
+            mtf50_vs_nyquist_ratio,
+            sampling_regime,
+        )
+        + (
+            1.0 if coverage_ok else 0.0,
+            coverage_margin_mm,
+            coverage_ratio_actual_vs_design,
+            fov_width_scale_vs_design,
+            fov_height_scale_vs_design,
+            fov_area_scale_vs_design,
+            effective_distortion_percent_at_actual_edge,
+            edge_position_error_mm_effective,
+        )
+        + (
+            relative_illumination_center_percent,
+            relative_illumination_corner_percent,
+            corner_to_center_ratio,
+            vignetting_loss_percent,
+            exposure_compensation_stops_at_corners,
+        )
+        + (
+            1.0 if axis_is_h else 0.0,
+            traversal_extent_mm,
+            duration_s,
+            expected_frames,
+            frames_min,
+            frames_max,
+            displacement_per_frame_mm,
+            displacement_per_frame_px,
+        )
+        + (
+            1.0 if diffraction_dominant else 0.0,
+            1.0 if exposure_limited_by_frame else 0.0,
+            1.0 if potential_vignetting else 0.0,
+        )
+    )
+
+
+@njit(cache=True, error_model="numpy")
+def _store_row(row: Tuple[float, ...], out: np.ndarray) -> None:
+    for k in range(_CORE_WIDTH):
+        out[k] = _from_core_float(row[k])
+
+
+# Single-configuration entry point: the sentinels are mapped back to inf in compiled code, so calculate only has
+# to turn the returned row into a list.
+@njit(f"f8[::1]{_CORE_ARGS}", cache=True, error_model="numpy")
+def _core_row(
+    sensor_w_mm: float,
+    sensor_h_mm: float,
+    sensor_diag_mm: float,
+    px_w_um: float,
+    px_h_um: float,
+    f_mm: float,
+    f_stop: float,
+    working_distance_mm: float,
+    sensor_fps: float,
+    allowed_blur_px: float,
+    object_speed_mm_s: float,
+    axis_is_h: bool,
+    lens_diag_mm: float,
+    lens_distortion_perc: float,
+    lens_resolution_lp_per_mm: float,
+    lens_relative_illumination: float,
+    target_fov_w: float,
+    target_fov_h: float,
+) -> np.ndarray:
+    out = np.empty(_CORE_WIDTH)
+    _store_row(
+        _core(
+            sensor_w_mm,
+            sensor_h_mm,
+            sensor_diag_mm,
+            px_w_um,
+            px_h_um,
+            f_mm,
+            f_stop,
+            working_distance_mm,
+            sensor_fps,
+            allowed_blur_px,
+            object_speed_mm_s,
+            axis_is_h,
+            lens_diag_mm,
+            lens_distortion_perc,
+            lens_resolution_lp_per_mm,
+            lens_relative_illumination,
+            target_fov_w,
+            target_fov_h,
+        ),
+        out,
+    )
+    return out
+
+
+def _calculate_key(key: Tuple[Any, ...]) -> Dict[str, Any]:
+    args = []
+    for (name, default), value in zip(_CORE_INPUTS, key):
+        if name == _MOTION_AXIS_KEY:
+            # The axis string is parsed once here; the kernel only sees the flag
+            motion_axis = _motion_axis(value)
+            args.append(motion_axis == "H")
+        elif default == 0.0:
+            args.append(_as_float(value) or 0.0)
+        else:
+            args.append(_as_float(value, default))
+    results = to_nested_dict(_core_row(*args).tolist())
+    results["appearances"]["appearance_axis_used"] = motion_axis
+    return results
+
+
+# Keyed on the raw input values, so a repeated configuration skips parsing as well as the kernel; calculate hands
+# out copies, never the cached dicts. Values compare by equality: NaN read from the input never matches, and
+# 0.0/-0.0 or 1/1.0 share an entry.
+_calculate_cached = functools.lru_cache(maxsize=128)(_calculate_key)
+
+
+def calculate(params: Dict[str, Any]) -> Dict[str, Any]:
+    key = tuple([params.get(name, default) for name, default in _CORE_INPUTS])
+    try:
+        results = _calculate_cached(key)
+    except TypeError:  # unhashable input values are computed without the cache
+        results = _calculate_key(key)
+    return {category: dict(fields) for category, fields in results.items()}
+
+
+@njit(parallel=True, cache=True)
+def _core_batch(
+    sensor_w_mm: np.ndarray,
+    sensor_h_mm: np.ndarray,
+    sensor_diag_mm: np.ndarray,
+    px_w_um: np.ndarray,
+    px_h_um: np.ndarray,
+    f_mm: np.ndarray,
+    f_stop: np.ndarray,
+    working_distance_mm: np.ndarray,
+    sensor_fps: np.ndarray,
+    allowed_blur_px: np.ndarray,
+    object_speed_mm_s: np.ndarray,
+    axis_is_h: np.ndarray,
+    lens_diag_mm: np.ndarray,
+    lens_distortion_perc: np.ndarray,
+    lens_resolution_lp_per_mm: np.ndarray,
+    lens_relative_illumination: np.ndarray,
+    target_fov_w: np.ndarray,
+    target_fov_h: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    for i in prange(out.shape[0]):
+        _store_row(
+            _core(
+                sensor_w_mm[i],
+                sensor_h_mm[i],
+                sensor_diag_mm[i],
+                px_w_um[i],
+                px_h_um[i],
+                f_mm[i],
+                f_stop[i],
+                working_distance_mm[i],
+                sensor_fps[i],
+                allowed_blur_px[i],
+                object_speed_mm_s[i],
+                axis_is_h[i],
+                lens_diag_mm[i],
+                lens_distortion_perc[i],
+                lens_resolution_lp_per_mm[i],
+                lens_relative_illumination[i],
+                target_fov_w[i],
+                target_fov_h[i],
+            ),
+            out[i],
+        )
+
+
+def _calculate_parallel(columns: Dict[str, np.ndarray], axis_is_h: np.ndarray, out: np.ndarray) -> None:
+    _core_batch(
+        *[np.ascontiguousarray((axis_is_h if key == _MOTION_AXIS_KEY else columns[key]).ravel()) for key, _ in _CORE_INPUTS],
+        out.reshape(-1).view(np.float64).reshape(-1, _CORE_WIDTH),
+    )
+
+
+def calculate_batch(params_arrays: Mapping[str, Any] | Sequence[Dict[str, Any]], xp: Any = np) -> np.ndarray:
+    if not isinstance(params_arrays, Mapping):
+        params_arrays = _coerce_params(params_arrays)
+    provided = {key: _as_float_array(params_arrays[key]) for key in PARAM_KEYS if key in params_arrays}
+    if "axis_is_h" in params_arrays:
+        axis_is_h = np.asarray(params_arrays["axis_is_h"], dtype=bool)
+    else:
+        axis = np.asarray(params_arrays.get(_MOTION_AXIS_KEY, "W"), dtype=str)
+        axis_is_h = np.char.upper(np.char.strip(axis)) == "H"
+    shape = np.broadcast_shapes(axis_is_h.shape, *(values.shape for values in provided.values()))
+    columns = {
+        key: np.broadcast_to(_missing_to(provided[key], default), shape) if key in provided else np.full(shape, default)
+        for key, default in _PARAM_DEFAULTS.items()
     }
+    axis_is_h = np.broadcast_to(axis_is_h, shape)
 
+    out = np.empty(shape, dtype=RESULT_DTYPE)
+    if xp is not np:
+        # Device arrays have no structured dtype: compute each field on the device, then copy into the host record
+        fields: Dict[str, Any] = {}
+        _calculate_columns({key: xp.asarray(values) for key, values in columns.items()}, xp.asarray(axis_is_h), fields, xp=xp)
+        for name in RESULT_DTYPE.names:
+            out[name] = xp.asnumpy(fields[name])
+    elif _HAVE_NUMBA and out.size >= _PARALLEL_MIN_ROWS:
+        _calculate_parallel(columns, axis_is_h, out)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            _calculate_columns(columns, axis_is_h, out)
+    return out
 
-def main() -> None:
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    input_path = os.path.join(script_dir, "input.json")
-    results_path = os.path.join(script_dir, "results.json")
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        params: Dict[str, Any] = json.load(f)
+def _calculate_columns(columns: Dict[str, np.ndarray], axis_is_h: np.ndarray, out: Any, xp: Any = np) -> None:
+    sensor_w_mm = columns["sensor_width_mm"]
+    sensor_h_mm = columns["sensor_height_mm"]
+    sensor_diag_mm = columns["sensor_diagonal_mm"]
+    sensor_diag_mm = xp.where((sensor_diag_mm == 0) & (sensor_w_mm > 0) & (sensor_h_mm > 0), xp.hypot(sensor_w_mm, sensor_h_mm), sensor_diag_mm)
+
+    px_w_mm = columns["sensor_pixel_size_width_um"] / 1000.0
+    px_h_mm = columns["sensor_pixel_size_height_um"] / 1000.0
+    pixel_size_mm_min = xp.minimum(xp.where(px_w_mm == 0, xp.inf, px_w_mm), xp.where(px_h_mm == 0, xp.inf, px_h_mm))
+
+    pixels_horz, pixels_vert = _sensor_pixels_batch(sensor_w_mm, sensor_h_mm, px_w_mm, px_h_mm, xp=xp)
+    total_pixels = xp.where((pixels_horz > 0) & (pixels_vert > 0), pixels_horz * pixels_vert, 0.0)
+    aspect_ratio = xp.where(sensor_h_mm > 0, sensor_w_mm / sensor_h_mm, xp.inf)
+
+    has_pitch = xp.isfinite(pixel_size_mm_min) & (pixel_size_mm_min > 0)
+    sensor_nyquist_lp_per_mm = xp.where(has_pitch, 1.0 / (2.0 * pixel_size_mm_min), xp.inf)
+
+    f_mm = columns["lens_focal_length_mm"]
+    f_stop = columns["lens_fstop"]
+    lens_diag_mm = columns["lens_diagonal_mm"]
+    lens_distortion_perc = columns["lens_distortion_perc"]
+    lens_resolution_lp_per_mm = columns["lens_resolution"]
+
+    working_distance_mm = columns["working_distance_mm"]
+    di_mm, m = _lens_geometry_batch(f_mm, working_distance_mm, xp=xp)
+    m_finite = xp.isfinite(m)
+    aperture_diameter_mm = xp.where(f_stop > 0, f_mm / f_stop, xp.inf)
+    effective_f_number = xp.where(f_stop > 0, f_stop * (1.0 + xp.where(m_finite, m, 0.0)), xp.inf)
+
+    has_m = m_finite & (m > 0)
+    fov_w_mm = xp.where(has_m, sensor_w_mm / m, xp.inf)
+    fov_h_mm = xp.where(has_m, sensor_h_mm / m, xp.inf)
+    fov_diag_mm = xp.hypot(fov_w_mm, fov_h_mm)
+    fov_area_mm2 = xp.where(xp.isfinite(fov_w_mm) & xp.isfinite(fov_h_mm), fov_w_mm * fov_h_mm, xp.inf)
+
+    pixels_per_mm_x = xp.where((fov_w_mm > 0) & (pixels_horz > 0), pixels_horz / fov_w_mm, 0.0)
+    pixels_per_mm_y = xp.where((fov_h_mm > 0) & (pixels_vert > 0), pixels_vert / fov_h_mm, 0.0)
+    mm_per_pixel_x = xp.where(pixels_per_mm_x > 0, 1.0 / pixels_per_mm_x, xp.inf)
+    mm_per_pixel_y = xp.where(pixels_per_mm_y > 0, 1.0 / pixels_per_mm_y, xp.inf)
+
+    target_fov_w = columns["target_fov_width"]
+    target_fov_h = columns["target_fov_height"]
+    fov_width_actual_vs_target_percent = xp.where(
+        (target_fov_w > 0) & xp.isfinite(fov_w_mm) & (fov_w_mm > 0), (fov_w_mm / target_fov_w) * 100.0, xp.nan
+    )
+    fov_height_actual_vs_target_percent = xp.where(
+        (target_fov_h > 0) & xp.isfinite(fov_h_mm) & (fov_h_mm > 0), (fov_h_mm / target_fov_h) * 100.0, xp.nan
+    )
+
+    sensor_fps = columns["sensor_framerate"]
+    frame_period_us = xp.where(sensor_fps > 0, 1e6 / sensor_fps, xp.inf)
+    allowed_blur_px = columns["object_allowed_blur_pixels"]
+    object_speed_mm_s = columns["object_initial_speed_mm_s"]
+    px_per_mm_axis = xp.where(axis_is_h, pixels_per_mm_y, pixels_per_mm_x)
+    object_speed_px_s = object_speed_mm_s * px_per_mm_axis
+    max_exposure_us_motion = xp.select(
+        [(object_speed_px_s > 0) & (allowed_blur_px > 0), object_speed_mm_s <= 0],
+        [1e6 * (allowed_blur_px / object_speed_px_s), xp.inf],
+        0.0,
+    )
+    max_exposure_us_frame = frame_period_us
+    # Always recommend exposure for <= 1 pixel blur on the selected axis
+    max_exposure_us_motion_1px = xp.where(object_speed_px_s > 0, 1e6 * (1.0 / object_speed_px_s), xp.inf)
+    recommended_exposure_us = xp.minimum(max_exposure_us_motion_1px, max_exposure_us_frame)
+
+    coc_mm = xp.where(xp.isfinite(pixel_size_mm_min), pixel_size_mm_min, xp.maximum(px_w_mm, px_h_mm))
+    dof = _dof_hyperfocal_batch(f_mm, f_stop, xp.where(coc_mm > 0, coc_mm, 1e-3), working_distance_mm, xp=xp)
+
+    diff = _diffraction_sampling_metrics_batch(xp.where(pixel_size_mm_min > 0, pixel_size_mm_min, 1e-6), xp.maximum(effective_f_number, 1e-9), xp=xp)
+    lens_mtf50_lp_per_mm = xp.where(xp.isnan(lens_resolution_lp_per_mm), 0.5 * diff["diffraction_cutoff_lp_per_mm"], lens_resolution_lp_per_mm)
+    diff_nyquist = diff["sensor_nyquist_lp_per_mm"]
+    mtf50_vs_nyquist_ratio = xp.where(diff_nyquist > 0, lens_mtf50_lp_per_mm / diff_nyquist, xp.inf)
+    nyquist_over_cutoff = diff["nyquist_over_diffraction_cutoff"]
+    sampling_regime = xp.select(
+        [nyquist_over_cutoff > 1.1, lens_mtf50_lp_per_mm < 0.9 * diff_nyquist, nyquist_over_cutoff < 0.9],
+        [0.0, 1.0, 2.0],
+        3.0,
+    )
+
+    has_coverage = (lens_diag_mm != 0) & (sensor_diag_mm != 0)
+    coverage_ok = has_coverage & (lens_diag_mm >= sensor_diag_mm)
+    coverage_margin_mm = xp.where(has_coverage, 0.5 * (lens_diag_mm - sensor_diag_mm), xp.nan)
+    coverage_ratio_actual_vs_design = xp.where(has_coverage & (lens_diag_mm > 0), sensor_diag_mm / lens_diag_mm, xp.nan)
+    has_ratio = xp.isfinite(coverage_ratio_actual_vs_design)
+    fov_area_scale_vs_design = xp.where(has_ratio, coverage_ratio_actual_vs_design ** 2, xp.nan)
+
+    effective_distortion_percent_at_actual_edge = xp.where(
+        ~xp.isnan(lens_distortion_perc) & has_ratio,
+        xp.where(coverage_ratio_actual_vs_design <= 1.0, lens_distortion_perc * coverage_ratio_actual_vs_design, lens_distortion_perc),
+        xp.nan,
+    )
+    edge_position_error_mm_effective = xp.where(
+        xp.isfinite(effective_distortion_percent_at_actual_edge),
+        (effective_distortion_percent_at_actual_edge / 100.0) * (0.5 * fov_diag_mm),
+        xp.nan,
+    )
+
+    illum = _illumination_metrics_batch(sensor_diag_mm, di_mm, columns["lens_relative_illumination"], xp=xp)
+
+    traversal_extent_mm = xp.where(axis_is_h, fov_h_mm, fov_w_mm)
+    duration_s = xp.where((object_speed_mm_s > 0) & xp.isfinite(traversal_extent_mm), traversal_extent_mm / object_speed_mm_s, xp.inf)
+    expected_frames = xp.where((sensor_fps > 0) & xp.isfinite(duration_s), duration_s * sensor_fps, xp.inf)
+    has_frames = xp.isfinite(expected_frames)
+    frames_min = xp.where(has_frames, xp.floor(expected_frames), 0.0)
+    frames_max = xp.where(has_frames, xp.ceil(expected_frames), 0.0)
+    displacement_per_frame_mm = xp.where(sensor_fps > 0, object_speed_mm_s / sensor_fps, xp.inf)
+    displacement_per_frame_px = xp.where(xp.isfinite(displacement_per_frame_mm), displacement_per_frame_mm * px_per_mm_axis, xp.inf)
+
+    diffraction_dominant = nyquist_over_cutoff > 1.0
+    exposure_limited_by_frame = xp.isfinite(max_exposure_us_frame) & xp.isfinite(max_exposure_us_motion) & (max_exposure_us_frame < max_exposure_us_motion)
+    potential_vignetting = ~coverage_ok | (illum["corner_to_center_ratio"] < 0.7)
+
+    out["pixels_horz"] = pixels_horz
+    out["pixels_vert"] = pixels_vert
+    out["total_pixels"] = total_pixels
+    out["aspect_ratio"] = aspect_ratio
+    out["sensor_nyquist_lp_per_mm"] = sensor_nyquist_lp_per_mm
+
+    out["aperture_diameter_mm"] = aperture_diameter_mm
+    out["effective_f_number"] = effective_f_number
+    out["working_distance_mm"] = working_distance_mm
+    out["image_distance_mm"] = di_mm
+    out["magnification_percent"] = xp.where(m_finite, m * 100.0, xp.inf)
+
+    out["fov_width_mm"] = fov_w_mm
+    out["fov_height_mm"] = fov_h_mm
+    out["fov_diagonal_mm"] = fov_diag_mm
+    out["fov_area_mm2"] = fov_area_mm2
+    out["pixels_per_mm_x"] = pixels_per_mm_x
+    out["pixels_per_mm_y"] = pixels_per_mm_y
+    out["mm_per_pixel_x"] = mm_per_pixel_x
+    out["mm_per_pixel_y"] = mm_per_pixel_y
+    out["fov_width_actual_vs_target_percent"] = fov_width_actual_vs_target_percent
+    out["fov_height_actual_vs_target_percent"] = fov_height_actual_vs_target_percent
+
+    out["object_speed_mm_s"] = object_speed_mm_s
+    out["object_speed_px_s"] = object_speed_px_s
+    out["frame_period_us"] = frame_period_us
+    out["max_exposure_us_motion_blur_for_allowed_blur_px"] = max_exposure_us_motion
+    out["max_exposure_us_frame"] = max_exposure_us_frame
+    out["recommended_exposure_us"] = recommended_exposure_us
+
+    for name, values in dof.items():
+        out[name] = values
+
+    out["wavelength_um"] = diff["wavelength_um"]
+    out["airy_disk_diameter_um"] = diff["airy_disk_diameter_um"]
+    out["airy_disk_diameter_pixels"] = diff["airy_disk_diameter_pixels"]
+    out["diffraction_cutoff_lp_per_mm"] = diff["diffraction_cutoff_lp_per_mm"]
+    out["nyquist_over_diffraction_cutoff"] = nyquist_over_cutoff
+    out["lens_mtf50_lp_per_mm"] = lens_mtf50_lp_per_mm
+    out["mtf50_vs_nyquist_ratio"] = mtf50_vs_nyquist_ratio
+    out["sampling_regime"] = sampling_regime
+
+    out["coverage_ok"] = coverage_ok
+    out["coverage_margin_mm"] = coverage_margin_mm
+    out["coverage_ratio_actual_vs_design"] = coverage_ratio_actual_vs_design
+    out["fov_width_scale_vs_design"] = coverage_ratio_actual_vs_design
+    out["fov_height_scale_vs_design"] = coverage_ratio_actual_vs_design
+    out["fov_area_scale_vs_design"] = fov_area_scale_vs_design
+    out["effective_distortion_percent_at_actual_edge"] = effective_distortion_percent_at_actual_edge
+    out["edge_position_error_mm_effective"] = edge_position_error_mm_effective
+
+    for name, values in illum.items():
+        out[name] = values
+
+    out["appearance_axis_used"] = axis_is_h
+    out["traversal_extent_mm"] = traversal_extent_mm
+    out["duration_s"] = duration_s
+    out["expected_frames"] = expected_frames
+    out["frames_min"] = frames_min
+    out["frames_max"] = frames_max
+    out["displacement_per_frame_mm"] = displacement_per_frame_mm
+    out["displacement_per_frame_px"] = displacement_per_frame_px
 
-    results = calculate(params)
+    out["diffraction_dominant"] = diffraction_dominant
+    out["exposure_limited_by_frame"] = exposure_limited_by_frame
+    out["potential_vignetting"] = potential_vignetting
 
-    with open(results_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+
+def to_nested_dict(row: np.void | Sequence[float]) -> Dict[str, Any]:
+    values = list(row.item() if isinstance(row, np.void) else row)
+    for index, decode in _DECODED_FIELDS:
+        values[index] = decode(values[index])
+    it = iter(values)
+    return {category: {name: next(it) for name in names} for category, names in _CORE_CATEGORIES}
+
+
+def monte_carlo(
+    nominal_params: Dict[str, Any],
+    sigmas: Dict[str, float],
+    n_trials: int,
+    percentiles: Sequence[float] = (5.0, 50.0, 95.0),
+    seed: int | None = None,
+) -> Dict[str, np.ndarray]:
+    if n_trials < 1:
+        raise ValueError(f"n_trials must be at least 1, got {n_trials}")
+    if not sigmas:
+        raise ValueError("sigmas must name at least one input to perturb")
+    unknown = [key for key in sigmas if key not in PARAM_KEYS]
+    if unknown:
+        raise ValueError(f"sigmas names inputs that calculate_batch does not read: {', '.join(unknown)}")
+    keys = tuple(sigmas)
+    rng = np.random.default_rng(seed)
+    deltas = rng.standard_normal((n_trials, len(keys))) * np.array([sigmas[key] for key in keys], dtype=np.float64)
+    samples = np.ascontiguousarray((np.array([float(nominal_params[key]) for key in keys]) + deltas).T)
+
+    params = dict(nominal_params)
+    params.update(zip(keys, samples))
+    out = calculate_batch(params)
+
+    # Sample quantiles without interpolation, so inf results (e.g. far_mm past the hyperfocal distance) stay inf
+    values = np.percentile(out.view(np.float64).reshape(n_trials, _CORE_WIDTH), percentiles, axis=0, method="inverted_cdf")
+    return dict(zip(RESULT_DTYPE.names, values.T))
+
+
+# Through-focus sweep for one lens: the hyperfocal distance and nominal diffraction figures are computed once,
+# and scan() only evaluates the distance-dependent terms. coc_mm doubles as the pixel pitch, as in calculate.
+class DofScanner:
+    def __init__(self, f_mm: float, f_number: float, coc_mm: float, wavelength_um: float = 0.55) -> None:
+        self.f_mm = float(f_mm)
+        self.f_number = float(f_number)
+        self.coc_mm = max(float(coc_mm), 1e-12)
+        self.wavelength_um = float(wavelength_um)
+        f = np.float64(self.f_mm)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.hyperfocal_mm = float(f * f / (self.f_number * self.coc_mm) + f)
+        # As in calculate, a missing or non-positive f-number has an infinite effective f-number
+        f_number_eff = self.f_number if self.f_number > 0 else math.inf
+        lambda_mm = self.wavelength_um / 1000.0
+        self.airy_um = 2.44 * self.wavelength_um * f_number_eff
+        self.nyquist_lp_per_mm = 1.0 / (2.0 * self.coc_mm)
+        self.cutoff_lp_per_mm = 1.0 / (lambda_mm * f_number_eff) if lambda_mm > 0 else math.inf
+        has_cutoff = math.isfinite(self.cutoff_lp_per_mm) and self.cutoff_lp_per_mm > 0
+        self.ratio = self.nyquist_lp_per_mm / self.cutoff_lp_per_mm if has_cutoff else math.inf
+        self._f_number_eff = f_number_eff
+
+    def scan(self, distances_mm: np.ndarray) -> Dict[str, np.ndarray]:
+        s = np.asarray(distances_mm, dtype=np.float64)
+        f = self.f_mm
+        H = self.hyperfocal_mm
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sf = s - f
+            near_mm = (H * s) / (H + sf)
+            far_mm = np.where(s >= H, np.inf, (H * s) / (H - sf))
+            # 1 + m from the thin-lens magnification m = f / (s - f); no magnification at or inside the focal length
+            bellows = np.where(s > f, 1.0 + f / sf, 1.0)
+        return {
+            "near_mm": near_mm,
+            "far_mm": far_mm,
+            "DOF_mm": far_mm - near_mm,
+            "effective_f_number": self._f_number_eff * bellows,
+            "airy_disk_diameter_um": self.airy_um * bellows,
+            "diffraction_cutoff_lp_per_mm": self.cutoff_lp_per_mm / bellows,
+            "nyquist_over_diffraction_cutoff": self.ratio * bellows,
+        }
+
+
+def _all_finite(results: Dict[str, Any]) -> bool:
+    return all(math.isfinite(value) for group in results.values() for value in group.values() if isinstance(value, float))
+
+
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dumps(results: Dict[str, Any], indent: bool) -> bytes:
+    # orjson writes inf/nan as null, so payloads with non-finite values keep the stdlib Infinity/NaN encoding
+    if orjson is not None and _all_finite(results):
+        return orjson.dumps(results, option=(orjson.OPT_INDENT_2 if indent else 0) | orjson.OPT_SORT_KEYS)
+    if indent:
+        return json.dumps(results, indent=2, sort_keys=True).encode("utf-8")
+    return json.dumps(results, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Imaging system calculator.")
+    parser.add_argument("--input", default=os.path.join(script_dir, "input.json"), help="JSON file with one parameter set")
+    parser.add_argument("--jsonl", help="JSON Lines file with one parameter set per line, evaluated as one batch")
+    parser.add_argument("--output", help="results file (default: results.json, or results.jsonl with --jsonl)")
+    args = parser.parse_args(argv)
+
+    if args.jsonl:
+        results_path = args.output or os.path.join(script_dir, "results.jsonl")
+        with open(args.jsonl, "rb") as f:
+            records = [_loads(line) for line in f if line.strip()]
+        columns = _coerce_params(records)
+        out = calculate_batch(columns)
+        with open(results_path, "wb") as f:
+            for row, axis in zip(out.tolist(), columns[_MOTION_AXIS_KEY].tolist()):
+                results = to_nested_dict(row)
+                results["appearances"]["appearance_axis_used"] = axis
+                f.write(_dumps(results, indent=False))
+                f.write(b"\n")
+    else:
+        results_path = args.output or os.path.join(script_dir, "results.json")
+        with open(args.input, "rb") as f:
+            params: Dict[str, Any] = _loads(f.read())
+        results = calculate(params)
+        with open(results_path, "wb") as f:
+            f.write(_dumps(results, indent=True))
 
     print(f"Wrote results to {results_path}")
 
@@ -0,0 +1,172 @@
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from run import (
+    RESULT_DTYPE,
+    _PARALLEL_MIN_ROWS,
+    DofScanner,
+    calculate,
+    calculate_batch,
+    cos4_corner_ratio,
+    main,
+    monte_carlo,
+    to_nested_dict,
+)
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "input.json"), "rb") as f:
+    NOMINAL = json.load(f)
+
+
+def _variant(**changes):
+    params = dict(NOMINAL)
+    for key, value in changes.items():
+        if value is None:
+            params.pop(key, None)
+        else:
+            params[key] = value
+    return params
+
+
+CASES = {
+    "nominal": NOMINAL,
+    "axis_h": _variant(object_motion_axis="H"),
+    "missing_pitch": _variant(sensor_pixel_size_width_um=None, sensor_pixel_size_height_um=None),
+    "missing_fstop": _variant(lens_fstop=None),
+    "missing_pitch_and_fstop": _variant(sensor_pixel_size_width_um=None, sensor_pixel_size_height_um=None, lens_fstop=None),
+    "missing_optional": _variant(
+        lens_distortion_perc=None, lens_resolution=None, lens_relative_illumination=None, target_fov_width=None, target_fov_height=None
+    ),
+    "beyond_hyperfocal": _variant(working_distance_mm=1e7),
+    "inside_focal_length": _variant(working_distance_mm=1.0),
+    "no_motion": _variant(object_initial_speed_mm_s=None, sensor_framerate=None),
+    "no_falloff": _variant(lens_relative_illumination=100.0),
+    "negative_zero_fstop": _variant(lens_fstop=-0.0),
+    "unparseable_fstop": _variant(lens_fstop="abc", sensor_framerate="64"),
+}
+
+
+class ResultsTestCase(unittest.TestCase):
+    def assertSameResults(self, expected, actual):
+        self.assertEqual(expected.keys(), actual.keys())
+        for category, fields in expected.items():
+            self.assertEqual(fields.keys(), actual[category].keys())
+            for name, value in fields.items():
+                other = actual[category][name]
+                with self.subTest(field=f"{category}.{name}"):
+                    if isinstance(value, float) and math.isnan(value):
+                        self.assertTrue(isinstance(other, float) and math.isnan(other), other)
+                    elif isinstance(value, float) and math.isfinite(value):
+                        # the compiled and NumPy formulas may differ in the last bit
+                        self.assertTrue(math.isclose(value, other, rel_tol=1e-12, abs_tol=1e-300), (value, other))
+                    else:
+                        self.assertEqual(value, other)
+
+
+class BatchParityTest(ResultsTestCase):
+    """calculate and every calculate_batch path must agree on the same configuration."""
+
+    def test_batch_matches_calculate(self):
+        for rows in (1, 8, _PARALLEL_MIN_ROWS):
+            for case, params in CASES.items():
+                with self.subTest(case=case, rows=rows):
+                    try:
+                        expected = calculate(params)
+                    except ZeroDivisionError:
+                        self.skipTest("without Numba the scalar path divides by zero here, as the original script did")
+                    for out in (calculate_batch([params] * rows), calculate_batch({key: [value] * rows for key, value in params.items()})):
+                        self.assertSameResults(expected, to_nested_dict(out[0]))
+                        self.assertSameResults(expected, to_nested_dict(out[-1]))
+
+
+class ExposureCompensationTest(unittest.TestCase):
+    def test_no_falloff_is_positive_zero(self):
+        for params in (_variant(lens_relative_illumination=100.0), _variant(lens_relative_illumination=None, working_distance_mm=1.0)):
+            with self.subTest(params=params):
+                stops = calculate(params)["illumination"]["exposure_compensation_stops_at_corners"]
+                self.assertEqual(math.copysign(1.0, stops), 1.0)
+                stops = calculate_batch([params])["exposure_compensation_stops_at_corners"][0]
+                self.assertEqual(math.copysign(1.0, stops), 1.0)
+
+
+class MonteCarloTest(unittest.TestCase):
+    def test_seeded_percentiles(self):
+        sigmas = {"lens_focal_length_mm": 0.1, "working_distance_mm": 5.0}
+        first = monte_carlo(NOMINAL, sigmas, 200, seed=7)
+        second = monte_carlo(NOMINAL, sigmas, 200, seed=7)
+        self.assertEqual(set(first), set(RESULT_DTYPE.names))
+        for name, values in first.items():
+            self.assertEqual(values.shape, (3,))
+            np.testing.assert_array_equal(values, second[name])
+        low, median, high = first["DOF_mm"]
+        self.assertLessEqual(low, median)
+        self.assertLessEqual(median, high)
+
+    def test_rejects_bad_arguments(self):
+        for sigmas, n_trials in (({"working_distance_mm": 1.0}, 0), ({}, 10), ({"lens_pixel_pitch_um": 0.1}, 10)):
+            with self.subTest(sigmas=sigmas, n_trials=n_trials):
+                with self.assertRaises(ValueError):
+                    monte_carlo(NOMINAL, sigmas, n_trials)
+
+
+class DofScannerTest(unittest.TestCase):
+    DISTANCES = np.array([1.0, 8.0, 50.0, 200.0, 1000.0, 1e5, 1e7])
+
+    def assertMatchesBatch(self, f_number):
+        params = _variant(lens_fstop=f_number)
+        expected = calculate_batch({**params, "working_distance_mm": self.DISTANCES})
+        coc_mm = NOMINAL["sensor_pixel_size_width_um"] / 1000.0
+        scan = DofScanner(NOMINAL["lens_focal_length_mm"], f_number, coc_mm).scan(self.DISTANCES)
+        for name in ("near_mm", "far_mm", "DOF_mm", "effective_f_number"):
+            with self.subTest(f_number=f_number, field=name):
+                np.testing.assert_allclose(scan[name], expected[name], rtol=1e-12)
+
+    def test_scan_matches_calculate_batch(self):
+        self.assertMatchesBatch(NOMINAL["lens_fstop"])
+
+    def test_zero_f_number(self):
+        self.assertMatchesBatch(0.0)
+
+
+class Cos4CornerRatioTest(unittest.TestCase):
+    def test_matches_calculate_estimate(self):
+        f_mm = NOMINAL["lens_focal_length_mm"]
+        for distance in (20.0, 200.0, 5000.0):
+            with self.subTest(working_distance_mm=distance):
+                expected = calculate(_variant(lens_relative_illumination=None, working_distance_mm=distance))
+                image_distance_mm = f_mm * distance / (distance - f_mm)
+                ratio = cos4_corner_ratio(NOMINAL["sensor_diagonal_mm"], image_distance_mm)
+                self.assertAlmostEqual(ratio, expected["illumination"]["corner_to_center_ratio"], places=12)
+
+    def test_no_image_distance_gives_one(self):
+        ratios = cos4_corner_ratio(NOMINAL["sensor_diagonal_mm"], np.array([0.0, -5.0, np.inf, -np.inf]))
+        np.testing.assert_array_equal(ratios, 1.0)
+
+
+class JsonlTest(ResultsTestCase):
+    def test_round_trip(self):
+        records = [NOMINAL, _variant(object_motion_axis="x"), _variant(object_motion_axis=" h ")]
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "input.jsonl")
+            target = os.path.join(tmp, "results.jsonl")
+            with open(source, "w") as f:
+                f.writelines(json.dumps(record) + "\n" for record in records)
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(["--jsonl", source, "--output", target])
+            with open(target) as f:
+                results = [json.loads(line) for line in f]
+        self.assertEqual(len(results), len(records))
+        self.assertEqual([r["appearances"]["appearance_axis_used"] for r in results], ["W", "X", "H"])
+        for record, written in zip(records, results):
+            with self.subTest(record=record):
+                self.assertSameResults(calculate(record), written)
+
+
+if __name__ == "__main__":
+    unittest.main()